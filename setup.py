@@ -1,11 +1,14 @@
 """SpikeTools setup script."""
 
 import os
+import re
+import ast
 from setuptools import setup, find_packages
 
-# Get the current version number from inside the module
+# Get the current version number from inside the module, parsing out the assignment
 with open(os.path.join('spiketools', 'version.py')) as version_file:
-    exec(version_file.read())
+    __version__ = ast.literal_eval(
+        re.search(r"__version__\s*=\s*(.+)", version_file.read()).group(1))
 
 # Load the long description from the README
 with open('README.rst') as readme_file:
@@ -7,10 +7,13 @@ import matplotlib.pyplot as plt
 
 from spiketools.measures.circular import bin_circular
 from spiketools.utils.options import get_avg_func
+from spiketools.modutils.dependencies import safe_import
 from spiketools.plts.annotate import add_vlines, add_text_labels
 from spiketools.plts.utils import check_ax, savefig
 from spiketools.plts.style import set_plt_kwargs
-from spiketools.plts.settings import TEXT_SETTINGS
+from spiketools.plts.settings import TEXT_SETTINGS, HIST_KWARGS
+
+fast_histogram = safe_import('fast_histogram')
 
 ###################################################################################################
 ###################################################################################################
@@ -34,13 +37,18 @@ def plot_lines(x_values, y_values, vline=None, ax=None, **plt_kwargs):
 
     ax = check_ax(ax, figsize=plt_kwargs.pop('figsize', None))
 
-    x_values = repeat(x_values) if (isinstance(x_values, np.ndarray) and x_values.ndim == 1) \
-        else x_values
+    shared_x = isinstance(x_values, np.ndarray) and x_values.ndim == 1
     y_values = [y_values] if (isinstance(y_values, np.ndarray) and y_values.ndim == 1) \
         else y_values
 
-    for x_vals, y_vals in zip(x_values, y_values):
-        ax.plot(x_vals, y_vals, **plt_kwargs)
+    # If x-values are shared across 1d y-values, plot all lines together in a single call
+    if shared_x and len(y_values) > 0 and all(np.ndim(y_vals) == 1 for y_vals in y_values):
+        ax.plot(x_values, np.column_stack(y_values), **plt_kwargs)
+
+    else:
+        x_values = repeat(x_values) if shared_x else x_values
+        for x_vals, y_vals in zip(x_values, y_values):
+            ax.plot(x_vals, y_vals, **plt_kwargs)
 
     add_vlines(vline, ax)
 
@@ -85,7 +93,7 @@ def plot_points(data, label=None, ax=None, **plt_kwargs):
     ax = check_ax(ax, figsize=plt_kwargs.pop('figsize', (2.5, 5)))
 
     n_points = len(data)
-    xs = np.zeros(n_points) + 0.1 * np.random.rand(n_points)
+    xs = 0.1 * np.random.rand(n_points)
 
     ax.plot(xs, data, '.', ms=20, alpha=0.5)
 
@@ -119,11 +127,28 @@ def plot_hist(data, bins=None, range=None, density=None,
         Axis object upon which to plot.
     plt_kwargs
         Additional arguments to pass into the plot function.
+
+    Notes
+    -----
+    If the optional dependency `fast_histogram` is available, and the data is 1d, and the
+    histogram is defined by a number of bins and a range, without density or any histogram
+    specific arguments, the counts are computed with `fast_histogram` and plotted as a bar plot.
     """
 
     ax = check_ax(ax, figsize=plt_kwargs.pop('figsize', None))
 
-    ax.hist(data, bins=bins, range=range, density=density, **plt_kwargs)
+    if fast_histogram and isinstance(bins, int) and range is not None and not density \
+        and plt_kwargs.keys().isdisjoint(HIST_KWARGS) and _is_1d(data):
+
+        data = np.asarray(data)
+        counts = fast_histogram.histogram1d(data, bins=bins, range=range)
+        # Include values at the end of the range in the last bin, matching `np.histogram`
+        counts[-1] += np.count_nonzero(data == range[1])
+
+        edges = np.linspace(*range, bins + 1)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **plt_kwargs)
+    else:
+        ax.hist(data, bins=bins, range=range, density=density, **plt_kwargs)
 
     if average:
         add_vlines(get_avg_func(average)(data), lw=4, color='red', alpha=0.8, ax=ax)
@@ -243,3 +268,14 @@ def plot_text(text, xpos=0.5, ypos=0.5, show_axis=False, ax=None, **plt_kwargs):
 
     if not show_axis:
         ax.axis('off')
+
+
+def _is_1d(data):
+    """Check whether data is a single 1d dataset, treating ragged collections as not 1d."""
+
+    try:
+        data = np.asarray(data)
+    except ValueError:
+        return False
+
+    return data.ndim == 1 and data.dtype != object
@@ -12,6 +12,13 @@ SET_KWARGS = ['title', 'xlim', 'ylim', 'xlabel', 'ylabel',
 # Define a list of other arguments to be caught
 OTHER_KWARGS = ['legend']
 
+# Define a list of arguments that are specific to histograms (and are not supported by bar plots)
+HIST_KWARGS = ['weights', 'cumulative', 'bottom', 'histtype', 'align',
+               'orientation', 'rwidth', 'log', 'stacked']
+
+# Define a list of arguments that are caught and used for saving figures
+SAVE_KWARGS = ['file_name', 'file_path', 'save_fig', 'save_kwargs', 'close']
+
 # Collect a list of the default matplotlib color cycle
 DEFAULT_COLORS = plt.rcParams['axes.prop_cycle'].by_key()['color']
 
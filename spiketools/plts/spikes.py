@@ -2,6 +2,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 from spiketools.utils.options import get_avg_func, get_var_func
 from spiketools.plts.data import plot_bar, plot_hist, plot_lines
@@ -63,10 +64,13 @@ def plot_waveform(waveform, timestamps=None, average=None, shade=None, add_trace
                **plt_kwargs)
 
     if add_traces:
-        ax.plot(timestamps, all_waveforms.T,
-                lw=custom_plt_kwargs.pop('traces_lw', 1),
-                alpha=custom_plt_kwargs.pop('traces_alpha', 0.5),
-                color=ax.lines[0].get_color())
+        line_color = ax.lines[-1].get_color()
+        # Traces are added as a single collection, with segments of shape [n_waveforms, n_times, 2]
+        segments = np.stack([np.broadcast_to(timestamps, all_waveforms.shape), all_waveforms], -1)
+        ax.add_collection(LineCollection(segments, colors=line_color,
+                                         linewidths=custom_plt_kwargs.pop('traces_lw', 1),
+                                         alpha=custom_plt_kwargs.pop('traces_alpha', 0.5)))
+        ax.autoscale_view()
 
     if shade is not None:
         ax.fill_between(timestamps, waveform - shade, waveform + shade,
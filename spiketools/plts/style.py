@@ -18,6 +18,11 @@ def set_plt_kwargs(func):
     @wraps(func)
     def decorated(*args, **kwargs):
 
+        # If no arguments to be set are given, skip straight to running the function
+        if not any(key in SET_KWARGS or 'title' in key or 'legend' in key for key in kwargs):
+            func(*args, **kwargs)
+            return
+
         setters = get_kwargs(kwargs, SET_KWARGS)
         title_kwargs = get_attr_kwargs(kwargs, 'title')
 
@@ -45,28 +45,29 @@ def plot_rasters(data, vline=None, colors=None, vshade=None,
     custom_plt_kwargs = get_kwargs(plt_kwargs, custom_kwargs)
 
     # This process infers whether there is are embedded lists of multiple conditions
-    check = False
-    for val in data:
-        # The try / except is to deal with potentially empty lists (trials with no spikes)
-        try:
-            # This allows for plotting a raster with a single trial
-            if isinstance(val, float):
-                break
-            # If this value is a collection, there are multiple conditions
-            elif isinstance(val[0], (list, np.ndarray)):
-                check = True
-                break
-        except (IndexError, TypeError):
-            continue
+    #   The first value that is either a scalar (single trial raster) or a non-empty collection
+    #   is found (skipping empty trials), and if its content is a collection, there are conditions
+    first = next((val for val in data if not hasattr(val, '__len__') or len(val) > 0), None)
+    check = hasattr(first, '__len__') and isinstance(first[0], (list, np.ndarray))
 
     # If multiple conditions, organize colors across trials, and flatten data for plotting
     if check:
-        lens = [len(el) for el in data]
+        lens = np.fromiter((len(el) for el in data), dtype=np.intp, count=len(data))
         colors = DEFAULT_COLORS[0:len(lens)] if not colors else colors
-        colors = flatten([[col] * ll for col, ll in zip(colors, lens)])
+        # A single color is passed through directly, otherwise colors are expanded per trial
+        if not isinstance(colors, str):
+            colors = [colors[ind] for ind in np.repeat(np.arange(len(lens)), lens)]
         data = flatten(data)
 
-    ax.eventplot(data, colors=colors, **plt_kwargs)
+    # Define line offsets explicitly, with a single line if data is a single trial of spike times
+    #   Offsets match eventplot defaults: 0, 1, ... for multiple lines, and 1 for a single line
+    n_lines = 1 if (first is not None and not hasattr(first, '__len__')) else max(len(data), 1)
+    offsets = np.arange(n_lines, dtype=float) if n_lines > 1 else np.ones(1)
+
+    ax.eventplot(data, colors=colors,
+                 lineoffsets=plt_kwargs.pop('lineoffsets', offsets),
+                 linelengths=plt_kwargs.pop('linelengths', 1.),
+                 **plt_kwargs)
 
     add_vlines(vline, ax,
                color=custom_plt_kwargs.pop('line_color', 'green'),
@@ -125,21 +126,41 @@ def plot_rate_by_time(x_vals, y_vals, average=None, shade=None, colors=None,
 
     colors = DEFAULT_COLORS[0:len(y_vals)] if not colors else colors
 
-    if isinstance(shade, str):
-        shade = [get_var_func(shade)(arr, 0) for arr in y_vals]
+    var_func = get_var_func(shade) if isinstance(shade, str) else None
+    avg_func = get_avg_func(average) if isinstance(average, str) else None
+
+    if var_func or avg_func:
+
+        # If all conditions have the same shape, stack them to compute measures in a single call
+        if all(np.shape(arr) == np.shape(y_vals[0]) for arr in y_vals):
+            y_vals = np.stack(y_vals)
+            if var_func:
+                shade = var_func(y_vals, 1)
+            if avg_func:
+                y_vals = avg_func(y_vals, 1)
+
+        else:
+            if var_func:
+                shade = [var_func(arr, 0) for arr in y_vals]
+            if avg_func:
+                y_vals = [avg_func(arr, 0) for arr in y_vals]
+
+    # Compute the lower and upper bounds of the shading across all conditions together
+    if shade is not None:
+        y_vals, shade = np.stack(y_vals), np.stack(shade)
+        lower, upper = y_vals - shade, y_vals + shade
 
-    if isinstance(average, str):
-        y_vals = [get_avg_func(average)(arr, 0) for arr in y_vals]
+    lw = plt_kwargs.pop('lw', 3)
+    shade_alpha = custom_plt_kwargs.pop('shade_alpha', 0.25)
 
     for ind, (ys, color) in enumerate(zip(y_vals, colors)):
 
         ax.plot(x_vals, ys, color=color,
                 label=labels[ind] if labels else None,
-                lw=plt_kwargs.pop('lw', 3), **plt_kwargs)
+                lw=lw, **plt_kwargs)
 
-        if shade:
-            ax.fill_between(x_vals, ys-shade[ind], ys+shade[ind],
-                            color=color, alpha=custom_plt_kwargs.pop('alpha', 0.25))
+        if shade is not None:
+            ax.fill_between(x_vals, lower[ind], upper[ind], color=color, alpha=shade_alpha)
 
     if labels:
         ax.legend(loc=custom_plt_kwargs.pop('legend_loc', 'best'))
@@ -7,6 +7,8 @@ from os.path import join as pjoin
 import matplotlib.pyplot as plt
 from matplotlib import gridspec
 
+from spiketools.plts.settings import SAVE_KWARGS
+
 ###################################################################################################
 ###################################################################################################
 
@@ -88,6 +90,11 @@ def savefig(func):
     @wraps(func)
     def decorated(*args, **kwargs):
 
+        # If no save related arguments are given, skip straight to running the function
+        if kwargs.keys().isdisjoint(SAVE_KWARGS):
+            func(*args, **kwargs)
+            return
+
         # Grab file name and path arguments, if they are in kwargs
         file_name = kwargs.pop('file_name', None)
         file_path = kwargs.pop('file_path', None)
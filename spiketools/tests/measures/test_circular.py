@@ -14,3 +14,8 @@ def test_bin_circular():
     bin_edges, counts = bin_circular(data)
 
     assert len(bin_edges) - 1 == len(counts)
+
+    # Check with a bin width that does not evenly divide the circle
+    bin_edges, counts = bin_circular(data, bin_width=25)
+    assert len(bin_edges) - 1 == len(counts)
+    assert sum(counts) == len(data)
@@ -1,11 +1,15 @@
 """Tests for spiketools.plts.data"""
 
 import numpy as np
+import matplotlib.pyplot as plt
+
+from pytest import mark
 
 from spiketools.tests.tutils import plot_test
 from spiketools.tests.tsettings import TEST_PLOTS_PATH
 
 from spiketools.plts.data import *
+from spiketools.plts.data import fast_histogram
 
 ###################################################################################################
 ###################################################################################################
@@ -19,6 +23,12 @@ def test_plot_lines():
     plot_lines(data1, data2, vline=0.5,
                file_path=TEST_PLOTS_PATH, file_name='tplot_line.png')
 
+    plot_lines(data1, [data2, data2 + 1],
+               file_path=TEST_PLOTS_PATH, file_name='tplot_lines_shared.png')
+
+    plot_lines([data1, data1[0:5]], [data2, data2[0:5]],
+               file_path=TEST_PLOTS_PATH, file_name='tplot_lines_list.png')
+
 @plot_test
 def test_plot_scatter(tdata):
 
@@ -41,6 +51,28 @@ def test_plot_hist(tdata):
     plot_hist(tdata, average='median',
               file_path=TEST_PLOTS_PATH, file_name='tplot_bar_opts.png')
 
+    plot_hist(tdata, bins=5, range=(0, 1),
+              file_path=TEST_PLOTS_PATH, file_name='tplot_bar_range.png')
+
+@mark.skipif(not fast_histogram, reason='requires fast_histogram')
+def test_plot_hist_fast():
+
+    data = np.append(np.random.uniform(0, 1, 100), [0, 0.5, 1, 1.5, -0.5])
+
+    plt.close('all')
+    plot_hist(data, bins=10, range=(0, 1))
+    counts = [patch.get_height() for patch in plt.gca().patches]
+    assert np.array_equal(counts, np.histogram(data, bins=10, range=(0, 1))[0])
+
+    # Check that histogram specific arguments use the histogram path
+    plot_hist(data, bins=10, range=(0, 1), histtype='step')
+
+    # Check that multiple datasets use the histogram path, with one histogram each
+    plt.close('all')
+    plot_hist(np.array([data, data]).T, bins=10, range=(0, 1))
+    assert len(plt.gca().containers) == 2
+    plot_hist([data, data[:50]], bins=10, range=(0, 1))
+
 @plot_test
 def test_plot_bar():
 
@@ -1,6 +1,7 @@
 """Tests for spiketools.plts.trials"""
 
 import numpy as np
+import matplotlib.pyplot as plt
 
 from spiketools.tests.tutils import plot_test
 from spiketools.tests.tsettings import TEST_PLOTS_PATH
@@ -18,11 +19,18 @@ def test_plot_rasters():
              [-0.50, -0.40, -0.50, 0.10, 0.125, 0.50, 0.80],
              [-0.85, -0.50, -0.25, 0.10, 0.40, 0.750, 0.950]]
     data2 = [data1, [[-0.40, 0.15, 0.50], [-0.50, 0.25, 0.80]]]
+    data3 = [[], data1[0], [], data1[1]]
 
     plot_rasters(data0, file_path=TEST_PLOTS_PATH, file_name='tplot_rasters0.png')
+    assert plt.gca().collections[0].get_lineoffset() == 1
     plot_rasters(data1, file_path=TEST_PLOTS_PATH, file_name='tplot_rasters1.png')
     plot_rasters(data2, colors=['blue', 'red'],
                  file_path=TEST_PLOTS_PATH, file_name='tplot_rasters2.png')
+    plot_rasters(data2, colors=['red', (0, 0, 1)],
+                 file_path=TEST_PLOTS_PATH, file_name='tplot_rasters2_mixed.png')
+    plot_rasters(data2, colors='red',
+                 file_path=TEST_PLOTS_PATH, file_name='tplot_rasters2_single.png')
+    plot_rasters(data3, file_path=TEST_PLOTS_PATH, file_name='tplot_rasters3.png')
 
 
 @plot_test
@@ -39,6 +47,12 @@ def test_plot_rate_by_time():
                       labels=['A', 'B'], stats=[0.5, 0.01, 0.5, 0.01, 0.5],
                       file_path=TEST_PLOTS_PATH, file_name='tplot_time_rates2.png')
 
+    plot_rate_by_time(x_vals, [y_vals1, y_vals2[0:2, :]], average='mean', shade='std',
+                      file_path=TEST_PLOTS_PATH, file_name='tplot_time_rates3.png')
+
+    plot_rate_by_time(x_vals, [[1, 2, 3, 4, 5], [2, 3, 4, 5, 6]], average='mean', shade='sem',
+                      file_path=TEST_PLOTS_PATH, file_name='tplot_time_rates4.png')
+
 def test_create_raster_title():
 
     title1 = create_raster_title('label1', 1.0, 2.0)
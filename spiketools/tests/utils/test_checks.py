@@ -30,6 +30,14 @@ def test_check_param_options():
 
     with raises(ValueError):
         check_param_options('a', 'test', ['b', 'c'])
+    with raises(ValueError):
+        check_param_options(['a'], 'test', ['b', 'c'])
+
+    # Check ignoring case
+    check_param_options('A', 'test', ['a', 'B'], ignore_case=True)
+    check_param_options('b', 'test', ['a', 'B'], ignore_case=True)
+    with raises(ValueError):
+        check_param_options('A', 'test', ['a', 'b'])
 
 def test_check_list_options():
 
@@ -37,6 +45,8 @@ def test_check_list_options():
 
     with raises(ValueError):
         check_list_options(['a', 'b', 'c'], 'test', ['b', 'c'])
+    with raises(ValueError):
+        check_list_options([['a'], 'b'], 'test', ['b', 'c'])
 
 def test_check_param_lengths():
 
@@ -52,6 +62,8 @@ def test_check_param_lengths():
     check_param_lengths([a1, a2], ['a1', 'a2'], expected_length=3)
     with raises(ValueError):
         check_param_lengths([a1, a2], ['a1', 'a2'], expected_length=2)
+    with raises(ValueError):
+        check_param_lengths([a1, a2], ['a1', 'a2'], expected_length=0)
 
 def test_check_array_orientation():
 
@@ -110,6 +122,7 @@ def test_check_axis():
     assert check_axis(None, arr2dr) == 1
     assert check_axis(None, arr2dc) == 0
     assert check_axis(None, arr2dr) == 1
+    assert check_axis(0, arr2dr) == 0
 
     # Test array list inputs
     arr_lst_1d = [arr1d, arr1d]
@@ -134,6 +147,11 @@ def test_check_bin_range():
     with warns(UserWarning):
         check_bin_range(values, edges3)
 
+    # Check that NaN values are ignored
+    check_bin_range(np.array([np.nan, 0.5, 1.5]), edges1)
+    with warns(UserWarning):
+        check_bin_range(np.array([np.nan, 0.5, 1.5]), edges2)
+
 def test_check_time_bins(tspikes):
 
     # Check precomputed time bins
@@ -151,6 +169,28 @@ def test_check_time_bins(tspikes):
     with warns(UserWarning):
         out = check_time_bins(0.5, [0, 5], tspikes, True)
 
+    # Check that the given time range is not modified
+    time_range = [0, 5]
+    check_time_bins(0.5, time_range)
+    assert time_range == [0, 5]
+
     # Test bin definition with no values provided
     tbins = check_time_bins(0.5, [0, 5])
     assert np.array_equal(tbins, np.arange(0, 5.5, 0.5))
+
+    # Test bin definition where float error could otherwise add an extra bin
+    tbins = check_time_bins(0.1, [0, 1.1])
+    assert len(tbins) == 12
+    assert np.isclose(tbins[-1], 1.1)
+
+    # Test millisecond bins over a long time range, where the end value should still be covered
+    tbins = check_time_bins(0.001, [0, 3600])
+    assert len(tbins) == 3600001
+    assert np.isclose(tbins[-1], 3600)
+    tbins = check_time_bins(0.001, [0, 3600.0004])
+    assert len(tbins) == 3600002
+    assert tbins[-1] >= 3600.0004
+
+    # Test that a reversed time range gives empty bins
+    tbins = check_time_bins(0.5, [5, 0])
+    assert tbins.size == 0
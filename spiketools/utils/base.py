@@ -1,5 +1,6 @@
 """Base utility functions, that manipulate basic data structures, etc."""
 
+from itertools import chain
 from collections import Counter
 
 ###################################################################################################
@@ -27,7 +28,7 @@ def flatten(lst):
     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
     """
 
-    return [item for sublist in lst for item in sublist]
+    return list(chain.from_iterable(lst))
 
 
 def lower_list(lst):
@@ -1,8 +1,8 @@
 """General purpose checker functions."""
 
 import warnings
-from copy import deepcopy
-from collections import defaultdict
+from math import ceil, isclose
+from functools import lru_cache
 
 import numpy as np
 
@@ -11,7 +11,7 @@ from spiketools.utils.base import lower_list
 ###################################################################################################
 ###################################################################################################
 
-AXISARG = defaultdict(lambda : -1, {'vector' : 0, 'row' : 1, 'column' : 0})
+AXISARG = {'vector' : 0, 'row' : 1, 'column' : 0}
 
 def check_param_range(param, label, bounds):
     """Check a parameter value is within an acceptable range.
@@ -31,9 +31,10 @@ def check_param_range(param, label, bounds):
         If a parameter that is being checked is out of range.
     """
 
-    if (param < bounds[0]) or (param > bounds[1]):
-        msg = "The provided value for the {} parameter is out of bounds. ".format(label) + \
-        "It should be between {:1.1f} and {:1.1f}.".format(*bounds)
+    lower, upper = bounds
+    if param < lower or param > upper:
+        msg = "The provided value for the {} parameter is out of bounds. " \
+              "It should be between {:1.1f} and {:1.1f}.".format(label, lower, upper)
         raise ValueError(msg)
 
 
@@ -58,15 +59,28 @@ def check_param_options(param, label, options, ignore_case=False):
     """
 
     if ignore_case:
-        options = lower_list(options)
+        options = _lower_options(tuple(options))
         param = param.lower()
 
     if param not in options:
         msg = "The provided value for the {} parameter is invalid. ".format(label) + \
-        "It should be chosen from {{{}}}.".format(str(options)[1:-1])
+        "It should be chosen from {{{}}}.".format(_format_labels(options))
         raise ValueError(msg)
 
 
+def _format_labels(labels):
+    """Format a collection of labels or options as a comma separated string, for messages."""
+
+    return ', '.join(map(repr, labels))
+
+
+@lru_cache(maxsize=128)
+def _lower_options(options):
+    """Convert a tuple of options to lowercase, caching the result for repeated checks."""
+
+    return tuple(lower_list(options))
+
+
 def check_param_lengths(params, labels, expected_length=None):
     """Check that a set of parameters have the same length.
 
@@ -86,15 +100,16 @@ def check_param_lengths(params, labels, expected_length=None):
     """
 
     plen = len(params[0])
-    for param in params[1:]:
+    for label, param in zip(labels[1:], params[1:]):
         if len(param) != plen:
-            msg = "These parameters should be the same length: {}.".format(str(labels)[1:-1])
+            msg = "These parameters should be the same length: {}. ".format(_format_labels(labels)) + \
+            "Parameter '{}' has length {}, not {}.".format(label, len(param), plen)
             raise ValueError(msg)
 
-    if expected_length:
+    if expected_length is not None:
         if plen != expected_length:
             msg = "These parameters should all have length {}: {}.".format(\
-                expected_length, str(labels)[1:-1])
+                expected_length, _format_labels(labels))
             raise ValueError(msg)
 
 
@@ -141,26 +156,24 @@ def check_array_orientation(arr):
     In such cases, 'row' is returned by default.
     """
 
-    assert arr.ndim < 4, "The check_array_orientation function only works up to 3d."
+    ndim = arr.ndim
+    assert ndim < 4, "The check_array_orientation function only works up to 3d."
 
-    if arr.ndim == 1:
-        orientation = 'vector'
+    if ndim == 1:
+        return 'vector'
 
-    else:
+    shape = arr.shape
+    n_last, n_prev = shape[-1], shape[-2]
 
-        # Special case - empty array, infer based on where zero dimension is
-        if 0 in arr.shape:
-            if arr.shape[-1] == 0:
-                orientation = 'row'
-            elif arr.shape[-2] == 0:
-                orientation = 'column'
+    # Special case - empty array, infer based on where zero dimension is
+    if n_last == 0:
+        orientation = 'row'
+    elif n_prev == 0:
+        orientation = 'column'
 
-        # Otherwise, infer shape based on the relative size of each dimension
-        else:
-            if arr.shape[-1] >= arr.shape[-2]:
-                orientation = 'row'
-            else:
-                orientation = 'column'
+    # Otherwise, infer shape based on the relative size of each dimension
+    else:
+        orientation = 'row' if n_last >= n_prev else 'column'
 
     return orientation
 
@@ -186,13 +199,8 @@ def check_array_lst_orientation(arr_lst):
         orientation = None
 
     else:
-        # Find an array with enough elements to infer orientation
-        array = arr_lst[0]
-        for cur_arr in arr_lst:
-            if cur_arr.size > 4:
-                array = cur_arr
-                break
-
+        # Find an array with enough elements to infer orientation, defaulting to the first array
+        array = next((cur_arr for cur_arr in arr_lst if cur_arr.size > 4), arr_lst[0])
         orientation = check_array_orientation(array)
 
     return orientation
@@ -219,14 +227,14 @@ def check_axis(axis, arr):
         If the axis could not be inferred, -1 is returned.
     """
 
-    if not axis:
+    if axis is None:
 
         if isinstance(arr, list):
             orientation = check_array_lst_orientation(arr)
         else:
             orientation = check_array_orientation(arr)
 
-        axis = AXISARG[orientation]
+        axis = AXISARG.get(orientation, -1)
 
     return axis
 
@@ -288,26 +296,33 @@ def check_time_bins(bins, time_range=None, values=None, check_range=False):
     array([0. , 0.5, 1. , 1.5, 2. ])
     """
 
-    # Take a copy of `time_range` (otherwise, can get an aliasing problem)
-    time_range = deepcopy(time_range)
-
     if isinstance(bins, (int, float)):
-        # If time range is given, update to include end value
-        if time_range:
-            time_range[1] = time_range[1] + bins
+        # Define the start and stop of the bins, with stop extended to include the end value
+        #   Note: `time_range` is not modified, so there is no need to copy it
+        if time_range is not None:
+            start, stop = time_range[0], time_range[1] + bins
         # Otherwise, define time range based on data
         else:
             assert values is not None, "check_time_bins: either `values` or `time_range` required"
-            time_range = [0, np.max(values) + bins]
-        bins = np.arange(*time_range, bins)
+            start, stop = 0, np.max(values) + bins
+
+        # Define the number of bin edges explicitly, so float error can't add an extra edge
+        #   Note: a reversed time range gives no bin edges (an empty array), as with `np.arange`
+        n_edges = (stop - start) / bins
+        n_edges = round(n_edges) if isclose(n_edges, round(n_edges), rel_tol=0, abs_tol=1e-9) \
+            else ceil(n_edges)
+
+        bin_size, bins = bins, np.arange(max(n_edges, 0), dtype=float)
+        bins *= bin_size
+        bins += start
 
     elif isinstance(bins, np.ndarray):
         # Check that bins are well defined (monotonically increasing)
         assert np.all(np.diff(bins) > 0), 'Bin definition is ill-formed.'
 
     # Check that given bin range matches the data values
-    if values is not None and values.size > 0:
-        if check_range:
-            check_bin_range(values, bins)
+    if check_range and values is not None and values.size > 0:
+        check_bin_range(values, bins)
 
     return bins
+